@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 from data_pipeline import (
     load_and_validate_csv,
+    infer_column_types,
     compute_summary_statistics,
     get_max_file_size_mb,
     get_numerical_columns,
@@ -22,6 +23,9 @@ if uploaded_file is not None:
         # Load and validate CSV
         df = load_and_validate_csv(uploaded_file)
 
+        # Convert numeric-, boolean- and date-like text columns
+        df, type_report = infer_column_types(df)
+
         st.success("File uploaded successfully!")
         st.write("Preview of the data:")
         st.dataframe(df.head())
@@ -49,6 +53,14 @@ if uploaded_file is not None:
             num_stats_df = num_stats_df.round(2)
             st.dataframe(num_stats_df)
 
+        # Datetime Statistics
+        if stats["datetime_stats"]:
+            st.subheader("Date Columns Statistics")
+            date_stats_df = pd.DataFrame.from_dict(
+                stats["datetime_stats"], orient="index"
+            ).astype(str)
+            st.dataframe(date_stats_df)
+
         # Categorical Statistics
         if stats["categorical_stats"]:
             st.subheader("Categorical Columns (Top 5 Values)")
@@ -77,6 +89,13 @@ if uploaded_file is not None:
         )
         st.dataframe(dtype_df)
 
+        # Type Inference
+        if type_report:
+            with st.expander("🔎 Type Inference (text columns)"):
+                inference_df = pd.DataFrame.from_dict(type_report, orient="index")
+                inference_df["coercion_rate"] = inference_df["coercion_rate"].round(3)
+                st.dataframe(inference_df)
+
         # Data Visualizations
         st.header("📊 Data Visualizations")
 
@@ -1,9 +1,39 @@
 import pandas as pd
 import chardet
 import os
+import warnings
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Type inference defaults
+INFERENCE_SAMPLE_SIZE = 1000  # non-null values sampled per column
+INFERENCE_THRESHOLD = 0.95  # minimum parse rate to convert a column
+INFERENCE_MAX_COLUMNS = 200  # object columns inspected per table
+
+BOOLEAN_VALUES = {
+    "true": True,
+    "false": False,
+    "yes": True,
+    "no": False,
+    "t": True,
+    "f": False,
+    "y": True,
+    "n": False,
+}
+BOOLEAN_PATTERN = r"(?i)^(?:" + "|".join(BOOLEAN_VALUES) + r")$"
+# Plain decimals only: no leading-zero integers (IDs, codes) and no inf/nan
+NUMERIC_PATTERN = r"^[+-]?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?$"
+# Numeric dates need a 4-digit year at one end, or "-"/"/" separators
+DATE_PATTERN = (
+    r"^(?:\d{4}[-/.]\d{1,2}[-/.]\d{1,2}"
+    r"|\d{1,2}[-/.]\d{1,2}[-/.]\d{4}"
+    r"|\d{1,2}([-/])\d{1,2}\1\d{2}"
+    r"|\d{1,2} [A-Za-z]{3,9},? \d{4}"
+    r"|[A-Za-z]{3,9} \d{1,2},? \d{4})"
+    r"(?:[ T]\d{1,2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?: ?[AaPp][Mm])?)?"
+    r"(?: ?(?:Z|[+-]\d{2}:?\d{2}))?$"
+)
+
 
 def get_max_file_size_mb():
     """
@@ -81,12 +111,205 @@ def load_and_validate_csv(file, max_size_mb=None):
     return df
 
 
+def _parse_numeric(text):
+    return pd.to_numeric(text, errors="coerce")
+
+
+def _parse_boolean(text):
+    return text.str.lower().map(BOOLEAN_VALUES)
+
+
+def _parse_datetime(text):
+    with warnings.catch_warnings():
+        # Silence format inference warnings; unparsed values become NaT
+        warnings.simplefilter("ignore", UserWarning)
+        warnings.simplefilter("ignore", FutureWarning)
+        try:
+            parsed = pd.to_datetime(text, errors="coerce")
+        except (ValueError, TypeError):
+            parsed = None
+        if parsed is None or not pd.api.types.is_datetime64_any_dtype(parsed):
+            # Mixed UTC offsets cannot share one dtype: normalise to UTC
+            try:
+                parsed = pd.to_datetime(text, errors="coerce", utc=True)
+            except (ValueError, TypeError):
+                parsed = None
+    if parsed is None or not pd.api.types.is_datetime64_any_dtype(parsed):
+        return pd.Series(pd.NaT, index=text.index, dtype="datetime64[ns]")
+    return parsed
+
+
+# (type name, regex kernel, vectorized parser), in priority order
+TYPE_CANDIDATES = [
+    ("numeric", NUMERIC_PATTERN, _parse_numeric),
+    ("boolean", BOOLEAN_PATTERN, _parse_boolean),
+    ("datetime", DATE_PATTERN, _parse_datetime),
+]
+
+
+def _parse_candidate(text, pattern, parser):
+    """Parse the values matching a candidate's regex kernel; the rest become null."""
+    matches = text[text.str.match(pattern)]
+    if matches.empty:
+        return matches, 0.0
+    parsed = parser(matches)
+    return parsed, float(parsed.notna().sum() / len(text))
+
+
+def infer_column_types(df, sample_size=None, threshold=None, max_columns=None):
+    """
+    Infer semantic types for text columns and convert them where possible.
+
+    Each object/string column is tested on a sample of its non-null values.
+    A candidate type (numeric, boolean, datetime) is only applied to the full
+    column when the sample parse rate reaches the threshold; the conversion is
+    then kept only if the full-column parse rate also reaches it. Values that
+    do not parse become null.
+
+    Args:
+        df: pandas DataFrame (not modified)
+        sample_size: Non-null values sampled per column (optional, default 1000)
+        threshold: Minimum parse rate, in (0, 1] (optional, default 0.95)
+        max_columns: Maximum number of text columns inspected (optional, default 200)
+
+    Returns:
+        tuple: (DataFrame with converted columns, dict of column -> {
+            inferred_type, candidate_type, coercion_rate, converted})
+
+        inferred_type is the applied type, "text" if no candidate passed,
+        "empty" for all-null columns or "skipped" beyond max_columns.
+        coercion_rate is the parse rate of candidate_type: the applied type,
+        or the best-scoring candidate for columns left as text.
+    """
+    if sample_size is None:
+        sample_size = INFERENCE_SAMPLE_SIZE
+    if threshold is None:
+        threshold = INFERENCE_THRESHOLD
+    if max_columns is None:
+        max_columns = INFERENCE_MAX_COLUMNS
+
+    if sample_size < 1:
+        raise ValueError(f"sample_size must be at least 1, got {sample_size}")
+    if not 0 < threshold <= 1:
+        raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+    if max_columns < 0:
+        raise ValueError(f"max_columns must be non-negative, got {max_columns}")
+
+    text_columns = [
+        col for col in df.columns if pd.api.types.is_string_dtype(df[col].dtype)
+    ]
+
+    report = {}
+    converted = {}
+
+    for i, col in enumerate(text_columns):
+        # Bound the cost on very wide tables
+        if i >= max_columns:
+            report[col] = {
+                "inferred_type": "skipped",
+                "candidate_type": None,
+                "coercion_rate": None,
+                "converted": False,
+            }
+            continue
+
+        values = df[col].dropna()
+        if values.empty:
+            report[col] = {
+                "inferred_type": "empty",
+                "candidate_type": None,
+                "coercion_rate": None,
+                "converted": False,
+            }
+            continue
+
+        sample = values
+        if len(values) > sample_size:
+            sample = values.sample(n=sample_size, random_state=0)
+        sample = sample.astype(str).str.strip()
+
+        result = {
+            "inferred_type": "text",
+            "candidate_type": None,
+            "coercion_rate": 0.0,
+            "converted": False,
+        }
+        text = None
+
+        for type_name, pattern, parser in TYPE_CANDIDATES:
+            _, rate = _parse_candidate(sample, pattern, parser)
+
+            if rate >= threshold:
+                # Sample passed: convert the whole column in one vectorized pass
+                if text is None:
+                    text = values.astype(str).str.strip()
+                parsed, rate = _parse_candidate(text, pattern, parser)
+
+            if rate < threshold:
+                if rate > result["coercion_rate"]:
+                    result["candidate_type"] = type_name
+                    result["coercion_rate"] = rate
+                continue
+
+            parsed = parsed.reindex(df.index)
+            if type_name == "boolean":
+                parsed = parsed.astype("boolean")
+            converted[col] = parsed
+            result = {
+                "inferred_type": type_name,
+                "candidate_type": type_name,
+                "coercion_rate": rate,
+                "converted": True,
+            }
+            break
+
+        report[col] = result
+
+    if converted:
+        df = df.copy(deep=False)
+        for col, series in converted.items():
+            df[col] = series
+
+    return df, report
+
+
+def is_numerical_column(series):
+    """
+    Check whether a column is numerical (int64, float64 or boolean as 0/1).
+
+    Args:
+        series: pandas Series
+
+    Returns:
+        bool: True if the column can be analysed numerically
+    """
+    return series.dtype in ["int64", "float64"] or pd.api.types.is_bool_dtype(
+        series.dtype
+    )
+
+
+def get_numerical_values(series):
+    """
+    Get the values of a numerical column, with booleans mapped to 0/1.
+
+    Args:
+        series: pandas Series
+
+    Returns:
+        pandas.Series: int64/float64 values (nulls preserved)
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.astype("float64")
+    return series
+
+
 def compute_summary_statistics(df):
     """
     Compute summary statistics for the dataset.
 
     Returns a dictionary with:
-    - numerical_stats: dict of column -> {mean, median, std}
+    - numerical_stats: dict of column -> {mean, median, std} (booleans as 0/1)
+    - datetime_stats: dict of column -> {min, max, range}
     - categorical_stats: dict of column -> {value: count} for top 5 values
     - null_counts: dict of column -> null count
     - data_types: dict of column -> dtype
@@ -94,12 +317,14 @@ def compute_summary_statistics(df):
     if df.empty:
         return {
             "numerical_stats": {},
+            "datetime_stats": {},
             "categorical_stats": {},
             "null_counts": {},
             "data_types": {},
         }
 
     numerical_stats = {}
+    datetime_stats = {}
     categorical_stats = {}
     null_counts = {}
     data_types = {}
@@ -109,12 +334,23 @@ def compute_summary_statistics(df):
         null_counts[col] = df[col].isnull().sum()
 
         # Numerical columns
-        if df[col].dtype in ["int64", "float64"]:
+        if is_numerical_column(df[col]):
             if not df[col].isnull().all():  # Skip if all values are null
+                values = get_numerical_values(df[col])
                 numerical_stats[col] = {
-                    "mean": df[col].mean(),
-                    "median": df[col].median(),
-                    "std": df[col].std(),
+                    "mean": values.mean(),
+                    "median": values.median(),
+                    "std": values.std(),
+                }
+        # Datetime columns
+        elif pd.api.types.is_datetime64_any_dtype(df[col].dtype):
+            if not df[col].isnull().all():
+                min_val = df[col].min()
+                max_val = df[col].max()
+                datetime_stats[col] = {
+                    "min": min_val,
+                    "max": max_val,
+                    "range": max_val - min_val,
                 }
         # Categorical columns (object/string)
         elif df[col].dtype == "object":
@@ -124,6 +360,7 @@ def compute_summary_statistics(df):
 
     return {
         "numerical_stats": numerical_stats,
+        "datetime_stats": datetime_stats,
         "categorical_stats": categorical_stats,
         "null_counts": null_counts,
         "data_types": data_types,
@@ -140,7 +377,7 @@ def get_numerical_columns(df):
     Returns:
         list: List of numerical column names
     """
-    return [col for col in df.columns if df[col].dtype in ["int64", "float64"]]
+    return [col for col in df.columns if is_numerical_column(df[col])]
 
 
 def generate_correlation_heatmap(df):
@@ -159,7 +396,7 @@ def generate_correlation_heatmap(df):
         return None  # Need at least 2 numerical columns for correlation
 
     # Calculate correlation matrix
-    corr_matrix = df[numerical_cols].corr()
+    corr_matrix = df[numerical_cols].apply(get_numerical_values).corr()
 
     # Create figure
     fig, ax = plt.subplots(figsize=(10, 8))
@@ -195,11 +432,11 @@ def generate_histogram(df, column):
     Returns:
         matplotlib.figure.Figure: Histogram figure
     """
-    if column not in df.columns or df[column].dtype not in ["int64", "float64"]:
+    if column not in df.columns or not is_numerical_column(df[column]):
         return None
 
     # Remove null values for plotting
-    data = df[column].dropna()
+    data = get_numerical_values(df[column]).dropna()
 
     if data.empty:
         return None
@@ -247,11 +484,11 @@ def generate_boxplot(df, column):
     Returns:
         matplotlib.figure.Figure: Boxplot figure
     """
-    if column not in df.columns or df[column].dtype not in ["int64", "float64"]:
+    if column not in df.columns or not is_numerical_column(df[column]):
         return None
 
     # Remove null values for plotting
-    data = df[column].dropna()
+    data = get_numerical_values(df[column]).dropna()
 
     if data.empty:
         return None
@@ -8,7 +8,7 @@ import sys
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from src.data_pipeline import detect_encoding, load_dataset, load_and_validate_csv, compute_summary_statistics, get_max_file_size_mb
+from src.data_pipeline import detect_encoding, load_dataset, load_and_validate_csv, compute_summary_statistics, get_max_file_size_mb, get_numerical_columns, infer_column_types
 
 def test_detect_encoding_with_path(tmp_path):
     # Create a temp file with known encoding
@@ -148,6 +148,7 @@ def test_compute_summary_statistics_empty_df():
     stats = compute_summary_statistics(df)
 
     assert stats['numerical_stats'] == {}
+    assert stats['datetime_stats'] == {}
     assert stats['categorical_stats'] == {}
     assert stats['null_counts'] == {}
     assert stats['data_types'] == {}
@@ -205,3 +206,107 @@ def test_compute_summary_statistics_more_than_5_categories():
     assert 'B' in top_values
     assert 'C' in top_values
     assert top_values['A'] == 2
+
+def test_infer_column_types_converts_with_stray_tokens():
+    df = pd.DataFrame({
+        'amount': ['10', '20.5', 'N/A'] + ['30'] * 97,
+        'joined': ['2020-01-01', '2021-02-03', 'unknown'] + ['2022-05-06'] * 97,
+        'active': ['yes', 'No', None] + ['TRUE'] * 97,
+        'name': ['John', 'Jane', 'Bob'] + ['Alice'] * 97
+    })
+    result, report = infer_column_types(df)
+
+    assert result['amount'].dtype == 'float64'
+    assert pd.isna(result['amount'][2])
+    assert pd.api.types.is_datetime64_any_dtype(result['joined'])
+    assert pd.isna(result['joined'][2])
+    assert result['active'].dtype == 'boolean'
+    assert result['active'][1] == False
+    assert pd.api.types.is_string_dtype(result['name'].dtype)
+
+    assert report['amount']['inferred_type'] == 'numeric'
+    assert report['amount']['coercion_rate'] == 0.99
+    assert report['active']['coercion_rate'] == 1.0
+    assert report['joined']['converted']
+    assert report['name'] == {'inferred_type': 'text', 'candidate_type': None, 'coercion_rate': 0.0, 'converted': False}
+
+    # Input DataFrame is left untouched
+    assert not pd.api.types.is_numeric_dtype(df['amount'])
+
+def test_infer_column_types_below_threshold():
+    df = pd.DataFrame({'mixed': ['1', '2', 'a', 'b']})
+    result, report = infer_column_types(df)
+
+    assert report['mixed']['converted'] is False
+    assert report['mixed']['inferred_type'] == 'text'
+    assert report['mixed']['candidate_type'] == 'numeric'
+    assert report['mixed']['coercion_rate'] == 0.5
+    assert list(result['mixed']) == ['1', '2', 'a', 'b']
+
+    result, report = infer_column_types(df, threshold=0.5)
+    assert report['mixed']['inferred_type'] == 'numeric'
+    assert 'mixed' in compute_summary_statistics(result)['numerical_stats']
+
+def test_infer_column_types_max_columns():
+    df = pd.DataFrame({f'col{i}': ['1', '2', '3'] for i in range(5)})
+    result, report = infer_column_types(df, max_columns=2)
+
+    assert [col for col in report if report[col]['converted']] == ['col0', 'col1']
+    assert report['col4'] == {'inferred_type': 'skipped', 'candidate_type': None, 'coercion_rate': None, 'converted': False}
+    assert not pd.api.types.is_numeric_dtype(result['col4'])
+
+def test_infer_column_types_ignores_non_text_columns():
+    df = pd.DataFrame({'num': [1, 2, 3], 'empty': [None, None, None]})
+    result, report = infer_column_types(df)
+
+    assert list(report) == ['empty']
+    assert report['empty'] == {'inferred_type': 'empty', 'candidate_type': None, 'coercion_rate': None, 'converted': False}
+    assert result['num'].dtype == 'int64'
+
+def test_infer_column_types_keeps_codes_and_versions_as_text():
+    df = pd.DataFrame({
+        'zip': ['00123', '02134', '10001'],
+        'version': ['1.2.3', '1.2.4', '1.10.0'],
+        'ratio': ['1.5', 'inf', 'Infinity']
+    })
+    result, report = infer_column_types(df)
+
+    assert not any(entry['converted'] for entry in report.values())
+    assert list(result['zip']) == ['00123', '02134', '10001']
+    assert list(result['version']) == ['1.2.3', '1.2.4', '1.10.0']
+
+def test_infer_column_types_mixed_utc_offsets():
+    df = pd.DataFrame({'ts': ['2020-01-01 10:00+01:00', '2020-06-01 10:00+02:00']})
+    result, report = infer_column_types(df)
+
+    assert report['ts']['inferred_type'] == 'datetime'
+    assert pd.api.types.is_datetime64_any_dtype(result['ts'])
+    assert result['ts'][0] == pd.Timestamp('2020-01-01 09:00', tz='UTC')
+
+def test_infer_column_types_invalid_arguments():
+    df = pd.DataFrame({'col': ['1', '2']})
+    with pytest.raises(ValueError, match="sample_size"):
+        infer_column_types(df, sample_size=0)
+    with pytest.raises(ValueError, match="threshold"):
+        infer_column_types(df, threshold=0)
+    with pytest.raises(ValueError, match="threshold"):
+        infer_column_types(df, threshold=1.5)
+
+def test_compute_summary_statistics_inferred_boolean_and_datetime():
+    df = pd.DataFrame({
+        'active': ['yes', 'no', 'yes', None],
+        'joined': ['2020-01-01', '2020-01-11', '2020-01-06', '2020-01-04']
+    })
+    result, _ = infer_column_types(df)
+    stats = compute_summary_statistics(result)
+
+    # Booleans are summarised as 0/1
+    assert stats['numerical_stats']['active']['mean'] == 2 / 3
+    assert stats['numerical_stats']['active']['median'] == 1.0
+    assert 'active' in get_numerical_columns(result)
+
+    joined = stats['datetime_stats']['joined']
+    assert joined['min'] == pd.Timestamp('2020-01-01')
+    assert joined['max'] == pd.Timestamp('2020-01-11')
+    assert joined['range'] == pd.Timedelta(days=10)
+    assert 'joined' not in stats['numerical_stats']